@@ -2,20 +2,320 @@ import pandas as pd
 import time
 import random
 import re
+import os
+import sys
+import atexit
+import signal
+import multiprocessing
+import asyncio
+import queue
+import sqlite3
+import shutil
 from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.options import Options
-from selenium.common.exceptions import TimeoutException, NoSuchElementException, WebDriverException
+from selenium.common.exceptions import NoSuchWindowException, WebDriverException
+from selectolax.lexbor import LexborHTMLParser as HTMLParser
 import logging
 
+try:
+    import httpx  # Optional: plain HTTP fast path (pip install "httpx[http2]")
+except ImportError:
+    httpx = None
+
+try:
+    import re2  # Optional: linear-time DFA matcher for the modal text fallback (pip install google-re2)
+except ImportError:
+    re2 = None
+
 # Set up logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# User agent to appear more like a regular browser (shared by Chrome and httpx)
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+
+# Maximum concurrent HTTP requests on the fast path
+HTTP_CONCURRENCY = 20
+
+# Patterns used on every container, compiled once
+_NON_DIGIT = re.compile(r'\D')
+_PHONE_RE = (re2 or re).compile(r'\d{2}\s?\d{4}\s?\d{4}')  # Scans whole modal texts; RE2 never backtracks
+
+# Deletes every Latin-1 character except the ASCII digits
+_DIGITS_ONLY = str.maketrans('', '', ''.join(chr(c) for c in range(256) if chr(c) not in '0123456789'))
+
+# How long to wait for the phone blocks to appear, and then for the modals to show a number
+BLOCK_WAIT_SECONDS = 10
+MODAL_WAIT_SECONDS = 10
+
+# Number of times a scrape is retried when the page navigates while it runs
+SCRAPE_ATTEMPTS = 3
+
+# Number of browser failures (each followed by a restart) before a profile is given up on
+BROWSER_ATTEMPTS = 3
+
+# The whole per-profile workflow as one async function, run with a single CDP
+# Runtime.evaluate: waits for the phone blocks, clicks every "Mostrar número de
+# teléfono" button at once, waits until the containers show two different
+# numbers (or the timeout passes) and returns a snapshot of the page HTML (null
+# without phone blocks). Scraped pages are marked, so a tab still showing the previous
+# profile is never read twice.
+_SCRAPE_PHONES_JS = """
+async (blockTimeoutMs, modalTimeoutMs) => {
+    const root = document.documentElement;
+
+    // Resolves true once check() passes (re-checked on every DOM change), or false on timeout
+    function waitFor(check, timeoutMs) {
+        return new Promise(resolve => {
+            if (check()) return resolve(true);
+            const observer = new MutationObserver(() => {
+                if (check()) {
+                    observer.disconnect();
+                    clearTimeout(timer);
+                    resolve(true);
+                }
+            });
+            const timer = setTimeout(() => {
+                observer.disconnect();
+                resolve(check());
+            }, timeoutMs);
+            observer.observe(document, {childList: true, subtree: true, attributes: true});
+        });
+    }
+
+    function findModal(target) {
+        if (target) {
+            try {
+                const modal = document.querySelector(target);
+                if (modal) return modal;
+            } catch (e) {}
+        }
+        return document.querySelector('.modal[data-id*="phone"].show, .modal[data-id*="phone"]:not(.fade)');
+    }
+
+    const hasBlocks = await waitFor(
+        () => !root.dataset.scraped && document.querySelector('[data-id="gdpr-show-number-block"]'),
+        blockTimeoutMs
+    );
+    if (!hasBlocks) return null;
+    root.dataset.scraped = '1';
+
+    // Each container in page order, with its modal target (null when the number is already shown)
+    const containers = [];
+    document.querySelectorAll('[data-id="gdpr-show-number-block"]').forEach(container => {
+        const shrinked = container.querySelector('span[data-id="shrinked-number"]');
+        const button = container.querySelector('[data-id="show-phone-number-modal"]');
+        if (shrinked && shrinked.innerText.includes('...') && button) {
+            button.click();
+            containers.push({target: button.getAttribute('data-target'), shrinked});
+        } else {
+            containers.push({target: null, shrinked});
+        }
+    });
+
+    // 10-digit numbers a container shows, in the order parse_phones reads them
+    // (null while its modal has no number yet)
+    function numbersOf({target, shrinked}) {
+        let texts;
+        if (target === null) {
+            texts = [shrinked ? shrinked.innerText : ''];
+        } else {
+            const modal = findModal(target);
+            if (!modal) return null;
+            texts = [
+                ...Array.from(modal.querySelectorAll('a[href^="tel:"]'), link => link.getAttribute('href')),
+                ...Array.from(modal.querySelectorAll('b, strong'), elem => elem.innerText),
+            ];
+            if (!texts.length) return null;
+        }
+        return texts.map(text => (text || '').replace(/\D/g, '')).filter(digits => digits.length === 10);
+    }
+
+    // Only two phones are kept, so stop once the containers ready so far (in page
+    // order) show two different numbers; containers repeating a number don't count
+    await waitFor(() => {
+        const seen = new Set();
+        for (const container of containers) {
+            const numbers = numbersOf(container);
+            if (numbers === null) return false;
+            const number = numbers.find(digits => !seen.has(digits));
+            if (number) seen.add(number);
+            if (seen.size >= 2) return true;
+        }
+        return true;
+    }, modalTimeoutMs);
+
+    return root.outerHTML;
+}
+"""
+_SCRAPE_PHONES_EXPRESSION = f"({_SCRAPE_PHONES_JS})({BLOCK_WAIT_SECONDS * 1000}, {MODAL_WAIT_SECONDS * 1000})"
+
+# Base port for each worker's Chrome remote debugging endpoint
+REMOTE_DEBUGGING_BASE_PORT = 9222
+
+# Slot numbers from here up are temporary (pid based) and aren't reused between runs
+WORKER_SLOT_FALLBACK_OFFSET = 10000
+
+# Small resource fetched when a browser starts so DNS, TCP and TLS to the site are warm
+PREWARM_URL = "https://www.doctoralia.com.mx/favicon.ico"
+
+# Chrome disk cache root, kept between runs so static assets aren't re-downloaded
+DISK_CACHE_DIR = "/tmp/doct-cache"
+
+# Resources the scraper never reads (images, fonts, CSS and trackers), blocked via CDP
+BLOCKED_URL_PATTERNS = [
+    "*.jpg", "*.jpeg", "*.png", "*.webp", "*.gif", "*.svg",
+    "*.woff*", "*.ttf", "*.css",
+    "*googletagmanager*", "*google-analytics*", "*doubleclick*", "*facebook.net*",
+]
+
+# Extractor owned by the current pool worker process, and its slot number
+_worker_extractor = None
+_worker_slot = None
+
+class JobQueue:
+    """
+    Scraping state shared by all processes, kept in SQLite in WAL mode
+    
+    Each Excel row (0-based index) is a job that goes pending -> inflight -> done,
+    with its phones stored next to it. Rows with the same URL are claimed and
+    finished together, so every URL is scraped once. Failed scrapes are counted
+    per row, so retry limits hold across workers and resumed runs.
+    """
+    
+    def __init__(self, db_path):
+        """
+        Open (and create if needed) the job database
+        
+        Args:
+            db_path (str): Path to the SQLite file
+        """
+        self.db_path = db_path
+        self.conn = sqlite3.connect(db_path, timeout=30, isolation_level=None)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS jobs("
+            "row INTEGER PRIMARY KEY, url TEXT, state TEXT, p1 TEXT, p2 TEXT, attempts INTEGER NOT NULL DEFAULT 0)"
+        )
+        self.conn.execute("CREATE INDEX IF NOT EXISTS jobs_url ON jobs(url)")
+    
+    def seed(self, jobs):
+        """
+        Insert the initial jobs
+        
+        Args:
+            jobs (list): (row, url, state, phone1, phone2) tuples
+        """
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            self.conn.executemany("INSERT OR IGNORE INTO jobs(row, url, state, p1, p2) VALUES (?, ?, ?, ?, ?)", jobs)
+            self.conn.execute("COMMIT")
+        except BaseException:
+            self.conn.execute("ROLLBACK")
+            raise
+    
+    def count(self):
+        """Return the total number of rows"""
+        return self.conn.execute("SELECT COUNT(*) FROM jobs").fetchone()[0]
+    
+    def pending_count(self, first_row, last_row):
+        """Return the number of pending rows between first_row and last_row (inclusive)"""
+        return self.conn.execute(
+            "SELECT COUNT(*) FROM jobs WHERE state = 'pending' AND row BETWEEN ? AND ?", (first_row, last_row)
+        ).fetchone()[0]
+    
+    def reset_inflight(self):
+        """Make rows claimed by an interrupted run pending again"""
+        self.conn.execute("UPDATE jobs SET state = 'pending' WHERE state = 'inflight'")
+    
+    def pop(self, first_row, last_row, limit=-1):
+        """
+        Atomically claim pending URLs, one job per URL
+        
+        Args:
+            first_row (int): First row to consider (0-based, inclusive)
+            last_row (int): Last row to consider (0-based, inclusive)
+            limit (int): Maximum number of URLs to claim (-1 for all)
+            
+        Returns:
+            list: (row_index, profile_url) tuples in row order
+        """
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            claimed = self.conn.execute(
+                """
+                UPDATE jobs SET state = 'inflight'
+                WHERE row IN (
+                    SELECT MIN(row) FROM jobs
+                    WHERE state = 'pending' AND row BETWEEN ? AND ?
+                    GROUP BY url ORDER BY MIN(row) LIMIT ?
+                )
+                RETURNING row, url
+                """,
+                (first_row, last_row, limit)
+            ).fetchall()
+            # Rows sharing a claimed URL get the same result, so claim them too
+            self.conn.executemany(
+                "UPDATE jobs SET state = 'inflight' WHERE url = ? AND state = 'pending'",
+                [(url,) for _, url in claimed]
+            )
+            self.conn.execute("COMMIT")
+        except BaseException:
+            self.conn.execute("ROLLBACK")
+            raise
+        return sorted(claimed)
+    
+    def finish(self, profile_url, phone1, phone2=""):
+        """Store the result for every claimed row with this URL"""
+        self.conn.execute(
+            "UPDATE jobs SET state = 'done', p1 = ?, p2 = ? WHERE url = ? AND state = 'inflight'",
+            (phone1, phone2, profile_url)
+        )
+    
+    def release(self, profile_url):
+        """Give claimed rows with this URL back to the queue"""
+        self.conn.execute("UPDATE jobs SET state = 'pending' WHERE url = ? AND state = 'inflight'", (profile_url,))
+    
+    def fail(self, profile_url, max_attempts, error):
+        """
+        Count a failed scrape for every claimed row with this URL
+        
+        The rows go back to the queue, or are finished with the error once
+        they have failed max_attempts times.
+        
+        Args:
+            profile_url (str): URL of the claimed rows
+            max_attempts (int): Failures allowed before the rows are given up on
+            error (str): Result stored when giving up
+            
+        Returns:
+            bool: True if the rows were given up on
+        """
+        attempts = self.conn.execute(
+            """
+            UPDATE jobs SET
+                attempts = attempts + 1,
+                state = CASE WHEN attempts + 1 >= :max THEN 'done' ELSE 'pending' END,
+                p1 = CASE WHEN attempts + 1 >= :max THEN :error ELSE p1 END,
+                p2 = CASE WHEN attempts + 1 >= :max THEN '' ELSE p2 END
+            WHERE url = :url AND state = 'inflight'
+            RETURNING attempts
+            """,
+            {"max": max_attempts, "error": error, "url": profile_url}
+        ).fetchall()
+        return any(count >= max_attempts for count, in attempts)
+    
+    def results(self):
+        """Return (row_index, phone1, phone2) for every finished row"""
+        return self.conn.execute("SELECT row, p1, p2 FROM jobs WHERE state = 'done' ORDER BY row").fetchall()
+    
+    def close(self):
+        """Close the database connection"""
+        self.conn.close()
+
 class DoctoraliaPhoneExtractor:
-    def __init__(self, excel_file_path, use_proxy=False, proxy_address=None):
+    def __init__(self, excel_file_path, use_proxy=False, proxy_address=None, num_workers=4, use_http=True,
+                 tabs_per_worker=4):
         """
         Initialize the extractor
         
@@ -23,43 +323,139 @@ class DoctoraliaPhoneExtractor:
             excel_file_path (str): Path to the Excel file
             use_proxy (bool): Whether to use a proxy
             proxy_address (str): Proxy address in format "ip:port"
+            num_workers (int): Number of worker processes, each with its own browser
+            use_http (bool): Try a plain HTTP fetch before falling back to the browser
+            tabs_per_worker (int): Profiles each worker loads at once, one browser tab each
         """
         self.excel_file_path = excel_file_path
         self.use_proxy = use_proxy
         self.proxy_address = proxy_address
+        self.num_workers = num_workers
+        self.use_http = use_http and httpx is not None
+        self.tabs_per_worker = tabs_per_worker
         self.driver = None
+        self.tab_handles = []
+        self.pool = None
+        self.jobs = None
+        self.state_db_path = excel_file_path + ".state.db" if excel_file_path else None
+        
+    def __enter__(self):
+        self.start_workers()
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop_workers(terminate=exc_type is not None)
+        return False
+    
+    def start_workers(self):
+        """Start the worker pool; each worker keeps one browser open until stop_workers()"""
+        if self.pool is not None:
+            return
+        
+        # Each worker process owns its own WebDriver (see _init_worker); the slot
+        # numbers give every browser the same profile directory on every run
+        logger.info(f"Starting {self.num_workers} workers")
+        context = multiprocessing.get_context("spawn")
+        slots = context.Queue()
+        for slot in range(self.num_workers):
+            slots.put(slot)
+        self.pool = context.Pool(
+            processes=self.num_workers,
+            initializer=_init_worker,
+            initargs=(slots, self.use_proxy, self.proxy_address)
+        )
+    
+    def stop_workers(self, terminate=False):
+        """
+        Stop the worker pool and close the workers' browsers
+        
+        Args:
+            terminate (bool): Stop immediately instead of finishing queued work
+        """
+        if self.pool is None:
+            return
+        
+        if terminate:
+            self.pool.terminate()
+        else:
+            # Let workers exit normally so their browsers are closed
+            self.pool.close()
+        self.pool.join()
+        self.pool = None
+        logger.info("Worker pool closed")
+        
+    def setup_driver(self, user_data_dir=None, debugging_port=None, disk_cache_dir=None):
+        """
+        Set up Chrome WebDriver with options
         
-    def setup_driver(self):
-        """Set up Chrome WebDriver with options"""
+        Args:
+            user_data_dir (str): Chrome profile directory (keeps parallel browsers apart)
+            debugging_port (int): Remote debugging port for this browser
+            disk_cache_dir (str): Directory for Chrome's disk cache
+        """
         chrome_options = Options()
         
         # Basic options for stability
         chrome_options.add_argument("--no-sandbox")
         chrome_options.add_argument("--disable-dev-shm-usage")
         chrome_options.add_argument("--disable-blink-features=AutomationControlled")
+        
+        # Turn off Chrome subsystems the scrape never uses to save memory and CPU per browser
+        chrome_options.add_argument("--disable-gpu")
+        chrome_options.add_argument("--disable-extensions")
+        chrome_options.add_argument("--disable-background-networking")
+        chrome_options.add_argument("--disable-default-apps")
+        chrome_options.add_argument("--disable-sync")
+        chrome_options.add_argument("--disable-translate")
+        chrome_options.add_argument("--mute-audio")
+        chrome_options.add_argument("--disable-features=TranslateUI,BlinkGenPropertyTrees,IsolateOrigins,site-per-process")
+        chrome_options.add_argument("--js-flags=--noexpose_wasm")
+        chrome_options.add_argument("--enable-features=NetworkService")
         chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
         chrome_options.add_experimental_option('useAutomationExtension', False)
         
         # User agent to appear more like a regular browser
-        chrome_options.add_argument("--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
+        chrome_options.add_argument(f"--user-agent={USER_AGENT}")
         
         # Proxy setup if needed
         if self.use_proxy and self.proxy_address:
             chrome_options.add_argument(f"--proxy-server={self.proxy_address}")
             logger.info(f"Using proxy: {self.proxy_address}")
         
+        # Separate profile and debugging port so parallel browsers don't collide
+        if user_data_dir:
+            chrome_options.add_argument(f"--user-data-dir={user_data_dir}")
+        if debugging_port:
+            chrome_options.add_argument(f"--remote-debugging-port={debugging_port}")
+        if disk_cache_dir:
+            chrome_options.add_argument(f"--disk-cache-dir={disk_cache_dir}")
+        
         # Uncomment the line below to run headless (without opening browser window)
         chrome_options.add_argument("--headless")
         
+        # Don't block on images/stylesheets; explicit waits decide when the page is ready
+        chrome_options.set_capability("pageLoadStrategy", "none")
+        
+        # Don't load images at all
+        chrome_options.add_experimental_option("prefs", {"profile.managed_default_content_settings.images": 2})
+        
         try:
             self.driver = webdriver.Chrome(options=chrome_options)
             self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+            self.block_resources()
             logger.info("Chrome WebDriver initialized successfully")
         except Exception as e:
             logger.error(f"Failed to initialize WebDriver: {e}")
             raise
     
-    def clean_phone(self, text):
+    def block_resources(self):
+        """Block resources that are never read in the current tab to cut bandwidth per profile"""
+        # CDP network settings are per tab, so every new tab needs them too
+        self.driver.execute_cdp_cmd("Network.enable", {})
+        self.driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
+    
+    @staticmethod
+    def clean_phone(text):
         """
         Clean extracted text to get only the phone number and format it
         
@@ -69,272 +465,594 @@ class DoctoraliaPhoneExtractor:
         Returns:
             str: Cleaned and formatted phone number or None
         """
-        # Remove non-digits
-        digits = re.sub(r'\D', '', text)
+        # Remove non-digits (the regex only runs for characters outside Latin-1)
+        d = text.translate(_DIGITS_ONLY)
+        if not d.isdigit():
+            d = _NON_DIGIT.sub('', d)
         # If exactly 10 digits (Mexican phone), format as XX XXXX XXXX
-        if len(digits) == 10:
-            return f"{digits[:2]} {digits[2:6]} {digits[6:]}"
-        return None
+        return f"{d[:2]} {d[2:6]} {d[6:]}" if len(d) == 10 else None
     
-    def extract_phones(self, profile_url, row_index):
+    def quit_driver(self):
+        """Close the browser, if one is running, and forget its tabs"""
+        if self.driver:
+            try:
+                self.driver.quit()
+                logger.info("WebDriver closed")
+            except Exception as e:
+                logger.warning(f"Error closing WebDriver: {e}")
+        self.driver = None
+        self.tab_handles = []
+    
+    def prewarm(self):
+        """Open a connection to the site before the first profile is requested"""
+        try:
+            # Returns right away with the "none" page load strategy
+            self.driver.get(PREWARM_URL)
+        except WebDriverException as e:
+            logger.warning(f"Connection prewarm failed: {e}")
+    
+    def extract_phones_batch(self, tasks):
         """
-        Extract up to two phone numbers from a single profile URL
+        Extract phone numbers from several profiles, one browser tab per profile
+        
+        Every tab starts loading before the first one is read, so the page
+        loads overlap with the reveal and parsing of the earlier tabs.
         
         Args:
-            profile_url (str): URL of the doctor's profile
-            row_index (int): Row index for logging purposes
+            tasks (list): (row_index, profile_url) tuples with 0-based row indexes
             
         Returns:
-            list: List of up to two cleaned phone numbers
+            list: (row_index, phones) tuples; phones is None when the browser failed
         """
-        extracted_phones = []  # Use list to maintain order and allow duplicates initially
+        # Open extra tabs the first time a batch needs them; handles are cached
+        # so later batches don't ask chromedriver for them again
+        if len(self.tab_handles) < len(tasks):
+            self.tab_handles = list(self.driver.window_handles)
+            while len(self.tab_handles) < len(tasks):
+                self.open_tab()
         
-        try:
-            logger.info(f"Processing row {row_index}: {profile_url}")
-            
-            # Navigate to the profile page
-            self.driver.get(profile_url)
+        # Start every navigation (returns right away with the "none" page load strategy)
+        loading = []
+        for position, (index, profile_url) in enumerate(tasks):
+            try:
+                logger.info(f"Processing row {index + 1}: {profile_url}")
+                try:
+                    self.driver.switch_to.window(self.tab_handles[position])
+                except NoSuchWindowException:
+                    logger.warning(f"Browser tab for row {index + 1} was closed, reopening it")
+                    self.reopen_closed_tabs()
+                    self.driver.switch_to.window(self.tab_handles[position])
+                self.driver.get(profile_url)
+                loading.append(True)
+            except WebDriverException as e:
+                logger.error(f"WebDriver error for row {index + 1}: {e}")
+                loading.append(False)
+        
+        results = []
+        for handle, (index, _), started in zip(self.tab_handles, tasks, loading):
+            phones = None
+            if started:
+                try:
+                    self.driver.switch_to.window(handle)
+                    phones = self.read_phones(index + 1)
+                except WebDriverException as e:
+                    logger.error(f"WebDriver error for row {index + 1}: {e}")
+            results.append((index, phones))
+        return results
+    
+    def open_tab(self):
+        """Open a new browser tab, block unused resources in it and cache its handle"""
+        self.driver.switch_to.new_window('tab')
+        self.block_resources()
+        self.tab_handles.append(self.driver.current_window_handle)
+    
+    def reopen_closed_tabs(self):
+        """Re-read the open tabs and replace every cached tab that was closed with a new one"""
+        open_handles = set(self.driver.window_handles)
+        if not open_handles:
+            raise NoSuchWindowException("Every browser tab was closed")
+        
+        # New tabs are opened from a live one and keep the closed tab's place in the cache
+        self.driver.switch_to.window(next(iter(open_handles)))
+        cached, self.tab_handles = self.tab_handles, []
+        for handle in cached:
+            if handle in open_handles:
+                self.tab_handles.append(handle)
+            else:
+                self.open_tab()
+    
+    def read_phones(self, row_index):
+        """
+        Reveal and extract up to two phone numbers from the profile open in the current tab
+        
+        Args:
+            row_index (int): Row index for logging purposes
             
-            # Wait for page to load
-            WebDriverWait(self.driver, 10).until(
-                EC.presence_of_element_located((By.TAG_NAME, "body"))
-            )
+        Returns:
+            list: List of up to two cleaned phone numbers (None if the browser failed)
+        """
+        try:
+            # Wait, reveal every container (multiple consultorios) and snapshot the page in one call
+            for attempt in range(1, SCRAPE_ATTEMPTS + 1):
+                try:
+                    response = self.driver.execute_cdp_cmd('Runtime.evaluate', {
+                        'expression': _SCRAPE_PHONES_EXPRESSION,
+                        'awaitPromise': True,
+                        'returnByValue': True,
+                    })
+                    break
+                except WebDriverException as e:
+                    # The profile replaced the previous page while the script was waiting
+                    if attempt == SCRAPE_ATTEMPTS:
+                        raise
+                    logger.info(f"Page changed during scrape for row {row_index}, retrying: {e.msg}")
             
-            # Random delay to avoid being detected as a bot
-            time.sleep(random.uniform(2, 4))
+            if 'exceptionDetails' in response:
+                logger.error(f"Scrape script failed for row {row_index}: {response['exceptionDetails'].get('text')}")
+                return []
             
-            # Find all phone containers (multiple consultorios)
-            try:
-                phone_containers = self.driver.find_elements(By.CSS_SELECTOR, '[data-id="gdpr-show-number-block"]')
-                logger.info(f"Found {len(phone_containers)} phone containers")
-                
-                for container_index, phone_container in enumerate(phone_containers):
-                    try:
-                        # Check if we already have 2 phones
-                        if len(extracted_phones) >= 2:
-                            break
-                            
-                        # Check if full number is already visible
-                        full_number_span = phone_container.find_element(By.CSS_SELECTOR, 'span[data-id="shrinked-number"]')
-                        partial_number = full_number_span.text.strip()
-                        
-                        # If it's a partial number (contains ...), we need to click the button
-                        if "..." in partial_number:
-                            logger.info(f"Container {container_index + 1}: Found partial number: {partial_number}. Attempting to reveal full number.")
-                            
-                            # Find the "Mostrar número de teléfono" button
-                            show_phone_button = phone_container.find_element(By.CSS_SELECTOR, '[data-id="show-phone-number-modal"]')
-                            
-                            # Get the specific modal target for this container
-                            modal_target = show_phone_button.get_attribute('data-target')
-                            logger.info(f"Modal target for container {container_index + 1}: {modal_target}")
-                            
-                            # Click the button
-                            self.driver.execute_script("arguments[0].click();", show_phone_button)
-                            
-                            # Wait for the specific modal to appear
-                            time.sleep(3)
-                            
-                            try:
-                                # Extract the modal data-id from the target attribute
-                                modal_data_id = None
-                                if modal_target:
-                                    # Extract data-id from target like "[data-id='address-469542-3310770736-2-phone"
-                                    match = re.search(r"data-id='([^']+)", modal_target)
-                                    if match:
-                                        modal_data_id = match.group(1)
-                                        logger.info(f"Looking for modal with data-id: {modal_data_id}")
-                                
-                                # Wait for the specific modal
-                                if modal_data_id:
-                                    modal = WebDriverWait(self.driver, 10).until(
-                                        EC.presence_of_element_located((By.CSS_SELECTOR, f'[data-id="{modal_data_id}"]'))
-                                    )
-                                else:
-                                    # Fallback to any visible phone modal
-                                    modal = WebDriverWait(self.driver, 10).until(
-                                        EC.presence_of_element_located((By.CSS_SELECTOR, '.modal[data-id*="phone"].show, .modal[data-id*="phone"]:not(.fade)'))
-                                    )
-                                
-                                logger.info(f"Modal appeared for container {container_index + 1}")
-                                
-                                # Wait a bit more for modal content to load
-                                time.sleep(1)
-                                
-                                # Extract phone from this specific modal
-                                phone_extracted = False
-                                
-                                # Primary: Find tel: links in this modal
-                                tel_links = modal.find_elements(By.CSS_SELECTOR, 'a[href^="tel:"]')
-                                for link in tel_links:
-                                    raw_phone = link.get_attribute('href').replace('tel:', '').strip()
-                                    cleaned = self.clean_phone(raw_phone)
-                                    if cleaned and cleaned not in extracted_phones:
-                                        extracted_phones.append(cleaned)
-                                        logger.info(f"Extracted phone from tel link in container {container_index + 1}: {cleaned}")
-                                        phone_extracted = True
-                                        break
-                                
-                                # Fallback: Find bold texts in this modal
-                                if not phone_extracted:
-                                    bold_elements = modal.find_elements(By.CSS_SELECTOR, 'b, strong')
-                                    for elem in bold_elements:
-                                        raw_text = elem.text.strip()
-                                        cleaned = self.clean_phone(raw_text)
-                                        if cleaned and cleaned not in extracted_phones:
-                                            extracted_phones.append(cleaned)
-                                            logger.info(f"Extracted phone from bold text in container {container_index + 1}: {cleaned}")
-                                            phone_extracted = True
-                                            break
-                                
-                                # Last fallback: Full modal text with regex
-                                if not phone_extracted:
-                                    modal_text = modal.text
-                                    matches = re.findall(r'\d{2}\s?\d{4}\s?\d{4}', modal_text)
-                                    for match in matches:
-                                        cleaned = self.clean_phone(match)
-                                        if cleaned and cleaned not in extracted_phones:
-                                            extracted_phones.append(cleaned)
-                                            logger.info(f"Extracted phone from modal text in container {container_index + 1}: {cleaned}")
-                                            phone_extracted = True
-                                            break
-                                
-                                # Close the modal properly
-                                try:
-                                    close_button = modal.find_element(By.CSS_SELECTOR, '[data-dismiss="modal"], .close, button[aria-label="Close"]')
-                                    self.driver.execute_script("arguments[0].click();", close_button)
-                                    time.sleep(2)  # Wait for modal to close completely
-                                except:
-                                    # Force close modal by hiding it
-                                    self.driver.execute_script("arguments[0].style.display = 'none';", modal)
-                                    # Also try to remove modal backdrop
-                                    try:
-                                        backdrops = self.driver.find_elements(By.CSS_SELECTOR, '.modal-backdrop')
-                                        for backdrop in backdrops:
-                                            self.driver.execute_script("arguments[0].remove();", backdrop)
-                                    except:
-                                        pass
-                                    time.sleep(2)
-                                
-                                logger.info(f"Modal closed for container {container_index + 1}")
-                                
-                            except TimeoutException:
-                                logger.warning(f"Modal did not appear for container {container_index + 1} in row {row_index}")
-                        
-                        else:
-                            # Full number might already be visible
-                            cleaned = self.clean_phone(partial_number)
-                            if cleaned and cleaned not in extracted_phones:
-                                extracted_phones.append(cleaned)
-                                logger.info(f"Full phone number already visible in container {container_index + 1}: {cleaned}")
-                        
-                        # Short delay between containers
-                        time.sleep(random.uniform(2, 3))
-                        
-                    except NoSuchElementException as e:
-                        logger.warning(f"Elements not found in container {container_index + 1} for row {row_index}: {e}")
-                        continue
-                    except Exception as e:
-                        logger.warning(f"Error processing container {container_index + 1} for row {row_index}: {e}")
-                        continue
-                        
-            except TimeoutException:
+            html = response['result'].get('value')
+            if not html:
                 logger.warning(f"No phone containers found for row {row_index}")
-            except Exception as e:
-                logger.warning(f"Error finding phone containers for row {row_index}: {e}")
+                return []
             
-            # Return list of unique phones (up to 2)
-            logger.info(f"Total phones extracted for row {row_index}: {extracted_phones}")
-            return extracted_phones[:2]  # Return maximum 2 phones
+            phones, _ = self.parse_phones(html, row_index)
+            return phones
                 
         except WebDriverException as e:
             logger.error(f"WebDriver error for row {row_index}: {e}")
-            return []
+            return None
         except Exception as e:
             logger.error(f"Unexpected error for row {row_index}: {e}")
             return []
     
-    def process_excel_file(self, start_row=2, max_rows=None):
+    def parse_phones(self, html, row_index):
         """
-        Process the Excel file and extract phone numbers
+        Extract up to two phone numbers from a profile page's HTML
         
         Args:
-            start_row (int): Starting row (1-based index, default is 2 to skip header)
-            max_rows (int): Maximum number of rows to process (None for all)
+            html (str): Page HTML, with the phone modals already revealed
+            row_index (int): Row index for logging purposes
+            
+        Returns:
+            tuple: (phones, unresolved) - up to two cleaned phone numbers, and the
+                number of shortened containers whose modal was missing or showed
+                no number
+        """
+        extracted_phones = []  # Use list to maintain order
+        seen = set()  # Same phones, for O(1) duplicate checks
+        unresolved = 0
+        tree = HTMLParser(html)
+        
+        # Find all phone containers (multiple consultorios)
+        phone_containers = tree.css('[data-id="gdpr-show-number-block"]')
+        logger.info(f"Found {len(phone_containers)} phone containers")
+        
+        for container_index, phone_container in enumerate(phone_containers):
+            # Check if we already have 2 phones
+            if len(seen) >= 2:
+                break
+            
+            full_number_span = phone_container.css_first('span[data-id="shrinked-number"]')
+            partial_number = full_number_span.text(strip=True) if full_number_span else ""
+            
+            if "..." not in partial_number:
+                # Full number might already be visible
+                cleaned = self.clean_phone(partial_number)
+                if cleaned and cleaned not in seen:
+                    seen.add(cleaned)
+                    extracted_phones.append(cleaned)
+                    logger.info(f"Full phone number already visible in container {container_index + 1}: {cleaned}")
+                continue
+            
+            # Without a reveal button there is no modal of its own to read
+            show_phone_button = phone_container.css_first('[data-id="show-phone-number-modal"]')
+            if show_phone_button is None:
+                logger.warning(f"No show number button in container {container_index + 1} in row {row_index}")
+                continue
+            
+            # Extract data-id from target like "[data-id='address-469542-3310770736-2-phone"
+            modal_target = show_phone_button.attributes.get('data-target')
+            modal_data_id = None
+            if modal_target and "data-id='" in modal_target:
+                modal_data_id = modal_target.split("data-id='", 1)[1].split("'", 1)[0]
+            
+            if modal_data_id:
+                modal = tree.css_first(f'[data-id="{modal_data_id}"]')
+            else:
+                # Fallback to any visible phone modal
+                modal = tree.css_first('.modal[data-id*="phone"].show, .modal[data-id*="phone"]:not(.fade)')
+            
+            if modal is None:
+                logger.warning(f"Modal did not appear for container {container_index + 1} in row {row_index}")
+                unresolved += 1
+                continue
+            
+            # Primary: tel: links, then bold texts, then the full modal text
+            candidates = (
+                ("tel link", [(link.attributes.get('href') or '').replace('tel:', '').strip() for link in modal.css('a[href^="tel:"]')]),
+                ("bold text", [elem.text(strip=True) for elem in modal.css('b, strong')]),
+                ("modal text", _PHONE_RE.findall(' '.join(modal.text(separator=' ').split()))),
+            )
+            has_number = False
+            for source, values in candidates:
+                numbers = [c for c in map(self.clean_phone, values) if c]
+                has_number = has_number or bool(numbers)
+                cleaned = next((c for c in numbers if c not in seen), None)
+                if cleaned:
+                    seen.add(cleaned)
+                    extracted_phones.append(cleaned)
+                    logger.info(f"Extracted phone from {source} in container {container_index + 1}: {cleaned}")
+                    break
+            if not has_number:
+                # The modal is there but its number hasn't been filled in
+                logger.warning(f"No number in the modal for container {container_index + 1} in row {row_index}")
+                unresolved += 1
+        
+        # Return list of unique phones (up to 2)
+        logger.info(f"Total phones extracted for row {row_index}: {extracted_phones}")
+        return extracted_phones[:2], unresolved  # Return maximum 2 phones
+    
+    async def fetch_phones(self, client, semaphore, profile_url, row_index):
+        """
+        Extract up to two phone numbers from the profile HTML without a browser
+        
+        The phone modals are part of the page markup, so the numbers can be
+        read straight from the HTML when the site serves them.
+        
+        Args:
+            client (httpx.AsyncClient): Shared HTTP client
+            semaphore (asyncio.Semaphore): Limits concurrent requests
+            profile_url (str): URL of the doctor's profile
+            row_index (int): Row index for logging purposes
+            
+        Returns:
+            list: List of up to two cleaned phone numbers (empty if the browser is needed)
         """
         try:
-            # Read the Excel file
-            logger.info(f"Reading Excel file: {self.excel_file_path}")
-            df = pd.read_excel(self.excel_file_path)
+            async with semaphore:
+                response = await client.get(profile_url)
+            response.raise_for_status()
             
-            if df.empty:
-                logger.error("Excel file is empty")
-                return
+            # Same parsing as the browser path, on the server-rendered markup
+            phones, unresolved = self.parse_phones(response.text, row_index)
+            if unresolved and len(phones) < 2:
+                # A number the page fills in with JavaScript could still be missing
+                logger.info(f"{unresolved} phone modals need the browser for row {row_index}")
+                return []
+            return phones
+        
+        except Exception as e:
+            logger.warning(f"HTTP fetch failed for row {row_index}: {e}")
+            return []
+    
+    async def fetch_all_phones(self, tasks):
+        """
+        Run fetch_phones concurrently over one pooled HTTP/2 client
+        
+        Args:
+            tasks (list): (row_index, profile_url) tuples with 0-based row indexes
             
-            # Ensure columns for Phone1 and Phone2 exist
-            if 'Phone1' not in df.columns:
-                df['Phone1'] = ""
-            if 'Phone2' not in df.columns:
-                df['Phone2'] = ""
+        Returns:
+            dict: row_index -> list of phones
+        """
+        semaphore = asyncio.Semaphore(HTTP_CONCURRENCY)
+        proxy = f"http://{self.proxy_address}" if self.use_proxy and self.proxy_address else None
+        async with httpx.AsyncClient(
+            http2=True,
+            headers={"User-Agent": USER_AGENT},
+            limits=httpx.Limits(max_keepalive_connections=50),
+            timeout=15,
+            follow_redirects=True,
+            proxy=proxy
+        ) as client:
+            results = await asyncio.gather(*(
+                self.fetch_phones(client, semaphore, profile_url, index + 1)
+                for index, profile_url in tasks
+            ))
+        return {index: phones for (index, _), phones in zip(tasks, results)}
+    
+    def _normalize_url(self, profile_url):
+        """
+        Ensure a profile URL is properly formatted
+        
+        Args:
+            profile_url (str): URL as written in the Excel file
+            
+        Returns:
+            str: Absolute URL
+        """
+        if not profile_url.startswith('http'):
+            profile_url = 'https://' + profile_url.lstrip('/')
+        return profile_url
+    
+    def _open_jobs(self):
+        """
+        Open the job queue, seeding it from the Excel file on first use
+        
+        Returns:
+            JobQueue: The job queue for this Excel file
+        """
+        if self.jobs is None:
+            self.jobs = JobQueue(self.state_db_path)
+            if self.jobs.count() == 0:
+                self._seed_jobs()
+        return self.jobs
+    
+    def _seed_jobs(self):
+        """Create one job per Excel row; rows with a result from a previous run start as done"""
+        # Read the Excel file
+        logger.info(f"Reading Excel file: {self.excel_file_path}")
+        df = pd.read_excel(self.excel_file_path)
+        
+        if df.empty:
+            logger.error("Excel file is empty")
+            return
+        
+        logger.info(f"Found {len(df)} rows in Excel file")
+        
+        def column_text(name):
+            # Cell values as text ("" when empty) so they can be stored in SQLite
+            if name not in df.columns:
+                return [""] * len(df)
+            return ["" if pd.isna(value) else str(value) for value in df[name]]
+        
+        urls = df.iloc[:, 0].to_numpy()  # Column A
+        phones1 = column_text('Phone1')
+        phones2 = column_text('Phone2')
+        
+        # Results for URLs already scraped in another row
+        finished_by_url = {
+            self._normalize_url(url): (phone1, phone2)
+            for url, phone1, phone2 in zip(urls, phones1, phones2)
+            if isinstance(url, str) and url and phone1
+        }
+        
+        jobs = []
+        for index, (url, phone1, phone2) in enumerate(zip(urls, phones1, phones2)):
+            if pd.isna(url) or not url:
+                jobs.append((index, None, 'done', phone1 or "No URL", ""))
+                continue
+            if not isinstance(url, str):
+                # Numbers, dates and the like can't be profile URLs
+                jobs.append((index, None, 'done', phone1 or f"Error: invalid URL {url}", ""))
+                continue
+            
+            profile_url = self._normalize_url(url)
+            if phone1:
+                jobs.append((index, profile_url, 'done', phone1, phone2))
+            elif profile_url in finished_by_url:
+                jobs.append((index, profile_url, 'done', *finished_by_url[profile_url]))
+            else:
+                jobs.append((index, profile_url, 'pending', None, None))
+        
+        self.jobs.seed(jobs)
+        logger.info(f"Job queue created at {self.state_db_path}")
+    
+    def export_excel(self):
+        """Write every finished row to the Excel file and delete the job queue"""
+        jobs = self._open_jobs()
+        results = jobs.results()
+        
+        df = pd.read_excel(self.excel_file_path)
+        
+        # Ensure columns for Phone1 and Phone2 exist
+        if 'Phone1' not in df.columns:
+            df['Phone1'] = ""
+        if 'Phone2' not in df.columns:
+            df['Phone2'] = ""
+        
+        if results:
+            # Empty columns are read back as floats; make them hold text
+            df['Phone1'] = df['Phone1'].astype(object)
+            df['Phone2'] = df['Phone2'].astype(object)
+            indexes, phones1, phones2 = zip(*results)
+            df.loc[list(indexes), 'Phone1'] = list(phones1)
+            df.loc[list(indexes), 'Phone2'] = list(phones2)
+        df.to_excel(self.excel_file_path, index=False)
+        logger.info(f"Saved {len(results)} rows to {self.excel_file_path}")
+        
+        jobs.close()
+        self.jobs = None
+        for suffix in ("", "-wal", "-shm"):
+            if os.path.exists(self.state_db_path + suffix):
+                os.remove(self.state_db_path + suffix)
+    
+    def process_excel_file(self, start_row=2, max_rows=None, export=True):
+        """
+        Process the Excel file and extract phone numbers
+        
+        Progress is kept in a SQLite job queue next to the Excel file, so an
+        interrupted run resumes where it stopped. Uses the running worker pool
+        if start_workers() was called (or the extractor is used as a context
+        manager), otherwise starts one just for this call.
+        
+        Args:
+            start_row (int): Starting row (1-based index, default is 2 to skip header)
+            max_rows (int): Maximum number of rows to process (None for all)
+            export (bool): Write the results to the Excel file when done (see export_excel)
             
-            logger.info(f"Found {len(df)} rows in Excel file")
+        Returns:
+            int: Number of rows in the Excel file
+        """
+        owns_pool = self.pool is None
+        failed = False
+        try:
+            jobs = self._open_jobs()
+            total_rows = jobs.count()
+            if total_rows == 0:
+                return 0
             
-            # Setup WebDriver
-            self.setup_driver()
+            # Nothing is in flight between calls; rows still claimed were left by a crash
+            jobs.reset_inflight()
             
-            # Process each row
             processed_count = 0
-            start_index = start_row - 1  # Convert to 0-based index
-            end_index = min(len(df), start_index + max_rows) if max_rows else len(df)
+            first_row = start_row - 1  # Convert to 0-based index
+            last_row = (min(total_rows, first_row + max_rows) if max_rows else total_rows) - 1
+            logger.info(f"{jobs.pending_count(first_row, last_row)} rows to process")
             
-            for index in range(start_index, end_index):
-                try:
-                    # Get URL from column A (index 0)
-                    profile_url = df.iloc[index, 0]  # Column A
-                    
-                    if pd.isna(profile_url) or not profile_url:
-                        logger.warning(f"No URL found in row {index + 1}")
-                        df.loc[index, 'Phone1'] = "No URL"
-                        continue
-                    
-                    # Ensure URL is properly formatted
-                    if not profile_url.startswith('http'):
-                        profile_url = 'https://' + profile_url.lstrip('/')
-                    
-                    # Extract phones
-                    phones = self.extract_phones(profile_url, index + 1)
-                    
-                    # Update columns
-                    df.loc[index, 'Phone1'] = phones[0] if phones else "No phone found"
-                    df.loc[index, 'Phone2'] = phones[1] if len(phones) > 1 else ""
-                    
-                    processed_count += 1
-                    logger.info(f"Processed {processed_count}/{end_index - start_index} profiles")
-                    
-                    # Save progress every 10 records
-                    if processed_count % 10 == 0:
-                        df.to_excel(self.excel_file_path, index=False)
-                        logger.info(f"Progress saved after {processed_count} records")
-                    
-                    # Random delay between requests
-                    time.sleep(random.uniform(3, 6))
+            # Fast path: plain HTTP; only rows it can't resolve go to the browsers
+            if self.use_http:
+                tasks = jobs.pop(first_row, last_row)
+                if tasks:
+                    try:
+                        http_results = asyncio.run(self.fetch_all_phones(tasks))
+                    except Exception as e:
+                        logger.warning(f"HTTP fast path unavailable, using the browser for all rows: {e}")
+                        http_results = {}
                     
-                except Exception as e:
-                    logger.error(f"Error processing row {index + 1}: {e}")
-                    df.loc[index, 'Phone1'] = f"Error: {str(e)}"
-                    continue
+                    for index, profile_url in tasks:
+                        phones = http_results.get(index)
+                        if phones:
+                            jobs.finish(profile_url, phones[0], phones[1] if len(phones) > 1 else "")
+                            processed_count += 1
+                        else:
+                            jobs.release(profile_url)
+                    logger.info(f"HTTP fast path resolved {processed_count}/{len(tasks)} profiles")
+            
+            # Browser path: each worker claims batches from the queue until it is empty
+            if jobs.pending_count(first_row, last_row):
+                self.start_workers()
+                job = (self.state_db_path, first_row, last_row, self.tabs_per_worker)
+                for scraped in self.pool.imap_unordered(_scrape_jobs, [job] * self.num_workers):
+                    processed_count += scraped
+                    logger.info(f"Processed {processed_count} profiles")
             
-            # Final save
-            df.to_excel(self.excel_file_path, index=False)
             logger.info(f"Processing complete. Updated {processed_count} records.")
             
+            if export:
+                self.export_excel()
+            return total_rows
+            
         except Exception as e:
             logger.error(f"Error processing Excel file: {e}")
+            failed = True
             raise
         finally:
-            if self.driver:
-                self.driver.quit()
-                logger.info("WebDriver closed")
+            if owns_pool:
+                self.stop_workers(terminate=failed)
+
+def _init_worker(slots, use_proxy, proxy_address):
+    """
+    Pool initializer: claim a worker slot and create this process's extractor
+    
+    The browser itself is started by the first _scrape_jobs call, so a Chrome
+    that fails to launch raises in the parent instead of making the pool
+    respawn workers forever.
+    
+    Args:
+        slots (multiprocessing.Queue): Free worker slot numbers
+        use_proxy (bool): Whether to use a proxy
+        proxy_address (str): Proxy address in format "ip:port"
+    """
+    global _worker_extractor, _worker_slot
+    
+    # Exit cleanly on terminate() so the atexit hook still closes the browser
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+    
+    # A fixed slot keeps the profile (HSTS, alt-svc, cache) across runs; a worker
+    # replacing one that crashed without releasing its slot falls back to its pid
+    try:
+        _worker_slot = slots.get(timeout=5)
+    except queue.Empty:
+        _worker_slot = os.getpid() % 10000 + WORKER_SLOT_FALLBACK_OFFSET
+    
+    # Registered first so the slot is handed back even when the browser fails to start
+    _worker_extractor = DoctoraliaPhoneExtractor(None, use_proxy=use_proxy, proxy_address=proxy_address)
+    atexit.register(_quit_worker_driver, slots, _worker_slot)
+
+def _slot_dirs(slot):
+    """Return the (profile, disk cache) directories of a worker slot"""
+    return f"/tmp/chrome-prof-{slot}", f"{DISK_CACHE_DIR}/{slot}"
+
+def _start_worker_driver():
+    """Start the worker's WebDriver with the profile, port and cache of its slot"""
+    user_data_dir, disk_cache_dir = _slot_dirs(_worker_slot)
+    _worker_extractor.setup_driver(
+        user_data_dir=user_data_dir,
+        debugging_port=REMOTE_DEBUGGING_BASE_PORT + _worker_slot,
+        disk_cache_dir=disk_cache_dir
+    )
+    _worker_extractor.prewarm()
+
+def _quit_worker_driver(slots, slot):
+    """
+    Close the worker's WebDriver when the process exits
+    
+    Args:
+        slots (multiprocessing.Queue): Free worker slot numbers
+        slot (int): This worker's slot, handed back for its replacement
+    """
+    if _worker_extractor:
+        _worker_extractor.quit_driver()
+    if slot < WORKER_SLOT_FALLBACK_OFFSET:
+        slots.put(slot)
+    else:
+        # Temporary slots are never reused, so their profile and cache would only pile up
+        for path in _slot_dirs(slot):
+            shutil.rmtree(path, ignore_errors=True)
+
+def _scrape_jobs(job):
+    """
+    Claim and scrape batches of profiles from the job queue until none are left
+    
+    Rows the browser failed on go back to the queue and the browser is
+    restarted; a profile is marked as an error after BROWSER_ATTEMPTS failures,
+    counted in the job queue across all workers.
+    
+    Args:
+        job (tuple): (state_db_path, first_row, last_row, batch_size); rows are
+            0-based and inclusive, batch_size is the number of browser tabs used
+        
+    Returns:
+        int: Number of profiles finished by this worker
+    """
+    state_db_path, first_row, last_row, batch_size = job
+    jobs = JobQueue(state_db_path)
+    scraped = 0
+    try:
+        while True:
+            # Started here rather than in _init_worker so a failure reaches the parent;
+            # also brings the browser back after a failure
+            if _worker_extractor.driver is None:
+                _start_worker_driver()
+            
+            batch = jobs.pop(first_row, last_row, batch_size)
+            if not batch:
+                break
+            
+            try:
+                results = _worker_extractor.extract_phones_batch(batch)
+            except Exception as e:
+                logger.error(f"Error processing rows {[index + 1 for index, _ in batch]}: {e}")
+                results = [(index, None) for index, _ in batch]
+            
+            browser_failed = False
+            for (index, profile_url), (_, phones) in zip(batch, results):
+                if phones is not None:
+                    jobs.finish(
+                        profile_url,
+                        phones[0] if phones else "No phone found",
+                        phones[1] if len(phones) > 1 else ""
+                    )
+                    scraped += 1
+                    continue
+                
+                # Back to the queue for a fresh browser (this worker's or another's) until the limit
+                browser_failed = True
+                if jobs.fail(profile_url, BROWSER_ATTEMPTS, "Error: browser failed"):
+                    logger.error(f"Giving up on row {index + 1} after {BROWSER_ATTEMPTS} browser failures")
+                    scraped += 1
+            
+            if browser_failed:
+                logger.warning("Restarting the browser after a WebDriver failure")
+                _worker_extractor.quit_driver()
+            
+            # Small random delay between batches to avoid being detected as a bot
+            time.sleep(random.uniform(1, 2))
+    finally:
+        jobs.close()
+    return scraped
 
 def main():
     """Main function to run the phone extractor"""
@@ -345,17 +1063,36 @@ def main():
     PROXY_ADDRESS = "proxy_ip:proxy_port"  # Update with actual proxy if needed
     START_ROW = 2  # Start from row 2 (assuming row 1 has headers)
     MAX_ROWS = 5000  # Process maximum 50 rows at a time (adjust as needed)
+    CHUNK_SIZE = 500  # Rows per chunk; progress is kept in the job queue between chunks
+    NUM_WORKERS = 4  # Parallel browsers (each uses ~300-500 MB of RAM)
+    USE_HTTP = True  # Try plain HTTP first; the browser handles rows it can't resolve (needs httpx)
+    TABS_PER_WORKER = 4  # Profiles loaded in parallel within each browser
     
     # Create extractor instance
     extractor = DoctoraliaPhoneExtractor(
         excel_file_path=EXCEL_FILE_PATH,
         use_proxy=USE_PROXY,
-        proxy_address=PROXY_ADDRESS if USE_PROXY else None
+        proxy_address=PROXY_ADDRESS if USE_PROXY else None,
+        num_workers=NUM_WORKERS,
+        use_http=USE_HTTP,
+        tabs_per_worker=TABS_PER_WORKER
     )
     
+    # Turn SIGTERM into a normal exit so the browsers are shut down
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+    
     try:
-        # Process the Excel file
-        extractor.process_excel_file(start_row=START_ROW, max_rows=MAX_ROWS)
+        # Process the Excel file chunk by chunk, reusing the same browsers
+        with extractor:
+            end_row = START_ROW + MAX_ROWS
+            for chunk_start in range(START_ROW, end_row, CHUNK_SIZE):
+                chunk_rows = min(CHUNK_SIZE, end_row - chunk_start)
+                total_rows = extractor.process_excel_file(start_row=chunk_start, max_rows=chunk_rows, export=False)
+                if chunk_start - 1 + chunk_rows >= total_rows:
+                    break
+            
+            # Write the Excel file once, after every chunk is done
+            extractor.export_excel()
         print("Phone extraction completed successfully!")
         
     except Exception as e: